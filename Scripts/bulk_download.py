@@ -2,23 +2,29 @@
 """
 Bulk download script for all emoji combinations from top 100 emojis.
 
-This script programmatically generates all possible combinations (100 x 100 = 10,000)
-and downloads them in parallel with optimized concurrency.
+This script programmatically generates all possible combinations (5,050 unordered
+pairs, or 100 x 100 = 10,000 with symmetric=False) and downloads them in parallel
+with optimized concurrency.
 """
 
 import asyncio
+import os
 import sys
 import time
+from collections import deque
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Tuple
-from itertools import product
+from typing import Deque, Dict, List, Optional, Set, Tuple
+from itertools import combinations_with_replacement, product
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.emoji_kitchen.api.client import EmojiKitchenClient
+from src.emoji_kitchen.api.metadata import MetadataManager
 from src.emoji_kitchen.storage.manager import StorageManager
 from src.emoji_kitchen.utils.emoji_utils import emoji_to_codepoint
+from src.emoji_kitchen.utils.reporting import PROGRESS_BATCH
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn, TimeElapsedColumn, TimeRemainingColumn
 from rich.panel import Panel
@@ -62,15 +68,29 @@ TOP_100_EMOJIS = [
 assert len(TOP_100_EMOJIS) == 100, f"Expected 100 emojis, got {len(TOP_100_EMOJIS)}"
 
 
+@dataclass(frozen=True, slots=True)
+class FailureRecord:
+    """A failed pair kept for the end-of-run summary."""
+
+    emoji1: str
+    emoji2: str
+    error: str
+
+
 class BulkDownloader:
     """Optimized bulk downloader for emoji combinations."""
 
+    # Failures kept in memory for the summary
+    FAILED_PAIRS_LIMIT = 200
+
     def __init__(
         self,
         output_dir: Path,
         size: int = 100,
         max_concurrent: int = 100,
-        delay_ms: int = 50
+        delay_ms: int = 50,
+        metadata: Optional[MetadataManager] = None,
+        symmetric: bool = True
     ):
         """
         Initialize bulk downloader.
@@ -80,13 +100,22 @@ class BulkDownloader:
             size: Image size in pixels
             max_concurrent: Maximum concurrent downloads
             delay_ms: Rate limiting delay in milliseconds
+            metadata: Loaded metadata used to skip combinations that don't exist
+            symmetric: Download A+B only once (the API returns the same
+                       image for B+A); set False to fetch both orderings
         """
         self.output_dir = Path(output_dir)
         self.size = size
         self.max_concurrent = max_concurrent
         self.delay_ms = delay_ms
+        self.metadata = metadata
+        self.symmetric = symmetric
 
-        self.storage = StorageManager(output_dir, filename_format='emoji')
+        self.storage = StorageManager(
+            output_dir,
+            filename_format='emoji',
+            symmetric=symmetric
+        )
 
         # Statistics
         self.successes = 0
@@ -94,13 +123,23 @@ class BulkDownloader:
         self.skipped = 0
         self.not_found = 0
 
-        # Track failures for reporting
-        self.failed_pairs: List[Tuple[str, str, str]] = []  # (emoji1, emoji2, error)
+        # Completed pairs (progress bar is refreshed every PROGRESS_BATCH)
+        self._completed = 0
+
+        # Track most recent failures for reporting (total is self.failures)
+        self.failed_pairs: Deque[FailureRecord] = deque(maxlen=self.FAILED_PAIRS_LIMIT)
 
-    def generate_all_combinations(self, emojis: List[str]) -> List[Tuple[str, str]]:
+    def generate_all_combinations(
+        self,
+        emojis: List[str]
+    ) -> List[Tuple[str, str]]:
         """
         Generate all possible emoji combinations.
 
+        With symmetric enabled, only one ordering of each pair is generated
+        (in codepoint order, matching StorageManager's canonical path).
+        If metadata is loaded, combinations it knows don't exist are dropped.
+
         Args:
             emojis: List of emojis
 
@@ -108,75 +147,88 @@ class BulkDownloader:
             List of (emoji1, emoji2) tuples
         """
         # Generate all combinations including same emoji with itself
-        return list(product(emojis, repeat=2))
+        if self.symmetric:
+            pairs = (
+                (emoji1, emoji2) if emoji1 <= emoji2 else (emoji2, emoji1)
+                for emoji1, emoji2 in combinations_with_replacement(emojis, 2)
+            )
+        else:
+            pairs = product(emojis, repeat=2)
+
+        if self.metadata is None:
+            return list(pairs)
+
+        # is_valid_combination returns None when metadata isn't loaded
+        return [
+            (emoji1, emoji2) for emoji1, emoji2 in pairs
+            if self.metadata.is_valid_combination(emoji1, emoji2) is not False
+        ]
 
-    async def download_batch_chunk(
+    def _advance(self, progress: Progress, task_id) -> None:
+        """Count a completed pair, pushing to the progress bar in batches."""
+        self._completed += 1
+        if self._completed % PROGRESS_BATCH == 0:
+            progress.update(task_id, completed=self._completed)
+
+    def _prefilter_existing(
         self,
-        client: EmojiKitchenClient,
-        pairs: List[Tuple[str, str]],
-        progress: Progress,
-        task_id
-    ):
+        emoji_pairs: List[Tuple[str, str]]
+    ) -> List[Tuple[str, str]]:
         """
-        Download a chunk of emoji pairs concurrently.
+        Drop pairs whose file already exists, counting them as skipped.
 
-        Args:
-            client: HTTP client
-            pairs: List of emoji pairs to download
-            progress: Rich progress bar
-            task_id: Progress task ID
-        """
-        # Process each pair
-        for emoji1, emoji2 in pairs:
-            # Check if already exists
-            if self.storage.file_exists(emoji1, emoji2):
-                self.skipped += 1
-                progress.update(task_id, advance=1)
-                continue
-
-            # Download
-            success, content, error, status_code = await client.download_image(
-                emoji1, emoji2, self.size
-            )
+        Scans each emoji directory once with os.scandir instead of
+        stat-ing every pair's path from inside the download workers.
 
-            if success and content:
-                try:
-                    self.storage.save(emoji1, emoji2, content)
-                    self.successes += 1
-                except Exception as e:
-                    self.failures += 1
-                    self.failed_pairs.append((emoji1, emoji2, str(e)))
-            else:
-                if status_code == 404:
-                    self.not_found += 1
-                else:
-                    self.failures += 1
-                    self.failed_pairs.append((emoji1, emoji2, error or "Unknown error"))
+        Args:
+            emoji_pairs: Pairs from generate_all_combinations
 
-            progress.update(task_id, advance=1)
+        Returns:
+            Pairs that still need downloading
+        """
+        paths = [self.storage.get_file_path(emoji1, emoji2) for emoji1, emoji2 in emoji_pairs]
 
-    async def download_all(
-        self,
-        emoji_pairs: List[Tuple[str, str]],
-        batch_size: int = 500
-    ):
+        existing: Dict[Path, Set[str]] = {}
+        for directory in {path.parent for path in paths}:
+            try:
+                with os.scandir(directory) as files:
+                    existing[directory] = {entry.name for entry in files if entry.is_file()}
+            except FileNotFoundError:
+                pass
+
+        remaining = [
+            pair for pair, path in zip(emoji_pairs, paths)
+            if path.name not in existing.get(path.parent, ())
+        ]
+        self.skipped += len(emoji_pairs) - len(remaining)
+        return remaining
+
+    async def download_all(self, emoji_pairs: List[Tuple[str, str]]):
         """
         Download all emoji combinations with progress tracking.
 
+        Pairs are fed through a bounded queue to max_concurrent workers, so
+        only that many downloads exist at once regardless of pair count.
+
         Args:
-            emoji_pairs: List of all emoji pairs to download
-            batch_size: Number of pairs per batch
+            emoji_pairs: Pairs from generate_all_combinations
         """
+        # Skip files from earlier runs before any tasks are created
+        emoji_pairs = self._prefilter_existing(emoji_pairs)
         total = len(emoji_pairs)
 
         console.print(Panel(
-            f"[bold]Downloading {total:,} emoji combinations[/bold]\n"
+            f"[bold]Downloading {total:,} emoji combinations[/bold]"
+            f" ({self.skipped:,} already downloaded)\n"
             f"Size: {self.size}x{self.size}px | Concurrency: {self.max_concurrent}",
             title="Emoji Kitchen Bulk Download",
             border_style="blue"
         ))
 
-        start_time = time.time()
+        start_time = time.perf_counter()
+
+        # Create all base emoji directories once
+        self.storage.prewarm_directories(emoji1 for emoji1, _ in emoji_pairs)
 
         # Create progress bar
         with Progress(
@@ -199,21 +251,42 @@ class BulkDownloader:
                 timeout_seconds=15.0,
                 max_retries=3
             ) as client:
-                # Process in batches for better memory management
-                for i in range(0, total, batch_size):
-                    batch = emoji_pairs[i:i + batch_size]
+                queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_concurrent * 2)
+
+                async def worker():
+                    while True:
+                        emoji1, emoji2 = await queue.get()
+                        try:
+                            await self.process_single(client, emoji1, emoji2)
+                        except Exception as e:
+                            # Keep the worker alive so the producer never stalls
+                            self.failures += 1
+                            self.failed_pairs.append(
+                                FailureRecord(emoji1, emoji2, str(e))
+                            )
+                        finally:
+                            queue.task_done()
+                            self._advance(progress, task_id)
+
+                workers = [
+                    asyncio.create_task(worker())
+                    for _ in range(self.max_concurrent)
+                ]
 
-                    # Create concurrent tasks for this batch
-                    tasks = []
-                    for pair in batch:
-                        tasks.append(
-                            self.process_single(client, pair[0], pair[1], progress, task_id)
-                        )
+                try:
+                    # Producer: blocks while the queue is full
+                    for pair in emoji_pairs:
+                        await queue.put(pair)
+                    await queue.join()
+                finally:
+                    for task in workers:
+                        task.cancel()
+                    await asyncio.gather(*workers, return_exceptions=True)
 
-                    # Run batch concurrently
-                    await asyncio.gather(*tasks)
+            # Flush the final partial batch
+            progress.update(task_id, completed=self._completed)
 
-        duration = time.time() - start_time
+        duration = time.perf_counter() - start_time
 
         # Print summary
         self.print_summary(duration)
@@ -222,16 +295,10 @@ class BulkDownloader:
         self,
         client: EmojiKitchenClient,
         emoji1: str,
-        emoji2: str,
-        progress: Progress,
-        task_id
+        emoji2: str
     ):
         """Process a single emoji pair download."""
-        # Check if already exists
-        if self.storage.file_exists(emoji1, emoji2):
-            self.skipped += 1
-            progress.update(task_id, advance=1)
-            return
+        file_path = self.storage.get_file_path(emoji1, emoji2)
 
         # Download
         success, content, error, status_code = await client.download_image(
@@ -240,19 +307,17 @@ class BulkDownloader:
 
         if success and content:
             try:
-                self.storage.save(emoji1, emoji2, content)
+                await self.storage.save_async(emoji1, emoji2, content, file_path)
                 self.successes += 1
             except Exception as e:
                 self.failures += 1
-                self.failed_pairs.append((emoji1, emoji2, str(e)))
+                self.failed_pairs.append(FailureRecord(emoji1, emoji2, str(e)))
         else:
             if status_code == 404:
                 self.not_found += 1
             else:
                 self.failures += 1
-                self.failed_pairs.append((emoji1, emoji2, error or "Unknown error"))
-
-        progress.update(task_id, advance=1)
+                self.failed_pairs.append(FailureRecord(emoji1, emoji2, error or "Unknown error"))
 
     def print_summary(self, duration: float):
         """Print download summary."""
@@ -274,14 +339,14 @@ class BulkDownloader:
         ))
 
         # Show some failure details if there are failures
-        if self.failed_pairs and len(self.failed_pairs) <= 20:
+        if self.failed_pairs and self.failures <= 20:
             console.print("\n[bold red]Failed downloads:[/bold red]")
-            for emoji1, emoji2, error in self.failed_pairs[:20]:
-                console.print(f"  {emoji1} + {emoji2}: {error}")
+            for failure in self.failed_pairs:
+                console.print(f"  {failure.emoji1} + {failure.emoji2}: {failure.error}")
         elif self.failed_pairs:
-            console.print(f"\n[bold red]First 20 of {len(self.failed_pairs)} failures:[/bold red]")
-            for emoji1, emoji2, error in self.failed_pairs[:20]:
-                console.print(f"  {emoji1} + {emoji2}: {error}")
+            console.print(f"\n[bold red]Last 20 of {self.failures:,} failures:[/bold red]")
+            for failure in list(self.failed_pairs)[-20:]:
+                console.print(f"  {failure.emoji1} + {failure.emoji2}: {failure.error}")
 
 
 async def main():
@@ -295,12 +360,18 @@ async def main():
     max_concurrent = 100  # High concurrency for speed
     delay_ms = 25  # Low delay for speed (API is quite tolerant)
 
+    # Use cached metadata (if present) to skip combinations that don't exist
+    metadata = MetadataManager()
+    if metadata.load_metadata():
+        console.print("Filtering combinations with cached metadata")
+
     # Initialize downloader
     downloader = BulkDownloader(
         output_dir=output_dir,
         size=size,
         max_concurrent=max_concurrent,
-        delay_ms=delay_ms
+        delay_ms=delay_ms,
+        metadata=metadata
     )
 
     # Generate all combinations
@@ -308,10 +379,15 @@ async def main():
     console.print(f"Generated {len(all_pairs):,} combinations")
 
     # Download all
-    await downloader.download_all(all_pairs, batch_size=500)
+    await downloader.download_all(all_pairs)
 
     console.print(f"\n[bold green]Downloads saved to:[/bold green] {output_dir}")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        import uvloop  # Optional: faster event loop for high task counts
+        run = uvloop.run
+    except ImportError:
+        run = asyncio.run
+    run(main())
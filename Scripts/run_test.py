@@ -54,5 +54,10 @@ async def main():
 
 
 if __name__ == '__main__':
-    exit_code = asyncio.run(main())
+    try:
+        import uvloop  # Optional: faster event loop for high task counts
+        run = uvloop.run
+    except ImportError:
+        run = asyncio.run
+    exit_code = run(main())
     sys.exit(exit_code)
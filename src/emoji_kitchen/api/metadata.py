@@ -2,8 +2,20 @@
 
 import json
 from pathlib import Path
-from typing import Optional, List, Tuple
+from typing import Optional, List, Tuple, Dict, Set
 import httpx
+from ..utils.emoji_utils import emoji_to_codepoint, codepoint_to_emoji
+
+try:
+    import orjson  # type: ignore[import-not-found]  # Optional: much faster parsing of the multi-MB metadata file
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import h2  # type: ignore[import-not-found]  # noqa: F401  Optional: enables HTTP/2 in httpx
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
 
 
 class MetadataManager:
@@ -33,26 +45,97 @@ class MetadataManager:
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
         self.cache_file = self.cache_dir / 'metadata.json'
+        self.etag_file = self.cache_dir / 'metadata.etag'
         self.metadata: Optional[dict] = None
 
+        # Lookup index built at load time: codepoint -> partner codepoints
+        self._index: Dict[str, Set[str]] = {}
+        self._emoji_by_code: Dict[str, str] = {}
+
+    @staticmethod
+    def _normalize_codepoint(codepoint: str) -> str:
+        """
+        Normalize a codepoint string for index lookups.
+
+        Metadata joins multi-part codepoints with '-' while emoji_to_codepoint
+        uses '_'; variation selectors (fe0f) are dropped so both spellings match.
+        """
+        parts = codepoint.lower().replace('-', '_').split('_')
+        return '_'.join(p for p in parts if p != 'fe0f')
+
+    def _build_index(self) -> None:
+        """Build the combination lookup index from loaded metadata."""
+        self._index = {}
+        self._emoji_by_code = {}
+
+        data = self.metadata.get('data') if isinstance(self.metadata, dict) else None
+        if not isinstance(data, dict):
+            return
+
+        for entry in data.values():
+            combinations = entry.get('combinations', {}) if isinstance(entry, dict) else {}
+            for records in combinations.values():
+                for record in records:
+                    left = record.get('leftEmojiCodepoint')
+                    right = record.get('rightEmojiCodepoint')
+                    if not left or not right:
+                        continue
+
+                    left_key = self._normalize_codepoint(left)
+                    right_key = self._normalize_codepoint(right)
+
+                    # Combinations are symmetric
+                    self._index.setdefault(left_key, set()).add(right_key)
+                    self._index.setdefault(right_key, set()).add(left_key)
+
+                    self._emoji_by_code.setdefault(
+                        left_key, record.get('leftEmoji') or codepoint_to_emoji(left.replace('-', '_'))
+                    )
+                    self._emoji_by_code.setdefault(
+                        right_key, record.get('rightEmoji') or codepoint_to_emoji(right.replace('-', '_'))
+                    )
+
     async def download_metadata(self) -> bool:
         """
         Download metadata from GitHub.
 
+        The response is streamed to the cache file in chunks. If a cached
+        copy exists, its ETag is sent so an unchanged file isn't re-downloaded.
+
         Returns:
-            True if successful, False otherwise
+            True if successful (or cache is current), False otherwise
         """
+        headers = {}
+        if self.cache_file.exists() and self.etag_file.exists():
+            headers['If-None-Match'] = self.etag_file.read_text(encoding='utf-8').strip()
+
+        tmp_file = self.cache_file.with_suffix('.json.part')
+
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(self.METADATA_URL, timeout=30.0)
-                response.raise_for_status()
+            async with httpx.AsyncClient(http2=HTTP2_AVAILABLE, timeout=30.0) as client:
+                async with client.stream('GET', self.METADATA_URL, headers=headers) as response:
+                    if response.status_code == 304:
+                        return True
+
+                    response.raise_for_status()
+
+                    # Stream to a temp file so a failed download can't corrupt the cache
+                    with tmp_file.open('wb') as f:
+                        async for chunk in response.aiter_bytes(64 * 1024):
+                            f.write(chunk)
+
+                    tmp_file.replace(self.cache_file)
 
-                # Save to cache
-                self.cache_file.write_bytes(response.content)
+                    etag = response.headers.get('etag')
+                    if etag:
+                        self.etag_file.write_text(etag, encoding='utf-8')
+                    elif self.etag_file.exists():
+                        self.etag_file.unlink()
 
                 return True
 
         except Exception as e:
+            tmp_file.unlink(missing_ok=True)
             print(f"Failed to download metadata: {e}")
             return False
 
@@ -67,8 +150,9 @@ class MetadataManager:
             return False
 
         try:
-            with self.cache_file.open('r', encoding='utf-8') as f:
-                self.metadata = json.load(f)
+            raw = self.cache_file.read_bytes()
+            self.metadata = orjson.loads(raw) if orjson else json.loads(raw)
+            self._build_index()
             return True
         except Exception as e:
             print(f"Failed to load metadata: {e}")
@@ -106,10 +190,11 @@ class MetadataManager:
         if not self.metadata:
             return []
 
-        # This is a simplified version
-        # Full implementation would parse the metadata structure
-        # For now, return empty list (metadata parsing can be added later)
-        return []
+        code = self._normalize_codepoint(emoji_to_codepoint(emoji))
+        return [
+            (emoji, self._emoji_by_code[partner])
+            for partner in sorted(self._index.get(code, ()))
+        ]
 
     def is_valid_combination(self, emoji1: str, emoji2: str) -> Optional[bool]:
         """
@@ -125,8 +210,9 @@ class MetadataManager:
         if not self.metadata:
             return None
 
-        # Simplified - full implementation would check metadata
-        return None
+        code1 = self._normalize_codepoint(emoji_to_codepoint(emoji1))
+        code2 = self._normalize_codepoint(emoji_to_codepoint(emoji2))
+        return code2 in self._index.get(code1, ())
 
     def get_cache_info(self) -> dict:
         """
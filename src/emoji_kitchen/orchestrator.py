@@ -1,9 +1,10 @@
 """Orchestrator for coordinating emoji combination downloads."""
 
 import asyncio
+import logging
 import time
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import Callable, List, Tuple, Optional
 from dataclasses import dataclass
 
 from .api.client import EmojiKitchenClient
@@ -13,11 +14,17 @@ from .utils.reporting import (
     print_summary,
     print_failures,
     create_progress_bar,
-    print_info
+    print_info,
+    set_progress,
+    PROGRESS_BATCH
 )
 
 
-@dataclass
+# Rows shown in the end-of-run failures table
+FAILURES_SHOWN = 20
+
+
+@dataclass(slots=True)
 class DownloadStats:
     """Statistics for a download session."""
     total: int = 0
@@ -78,6 +85,16 @@ class DownloadOrchestrator:
 
         self.stats = DownloadStats()
 
+        # Shared HTTP client (opened once per download session)
+        self._client: Optional[EmojiKitchenClient] = None
+
+    def _create_client(self) -> EmojiKitchenClient:
+        """Create an HTTP client configured for this orchestrator."""
+        return EmojiKitchenClient(
+            delay_ms=self.delay_ms,
+            max_concurrent=self.max_concurrent
+        )
+
     async def download_pair(
         self,
         emoji1: str,
@@ -87,6 +104,9 @@ class DownloadOrchestrator:
         """
         Download a single emoji pair.
 
+        Must be called while a session client is open (see download_batch
+        and download_single).
+
         Args:
             emoji1: First emoji
             emoji2: Second emoji
@@ -94,81 +114,142 @@ class DownloadOrchestrator:
 
         Returns:
             Tuple of (success, error_message)
+
+        Raises:
+            RuntimeError: If no session client is open
         """
-        start_time = time.time()
+        client = self._client
+        if client is None:
+            raise RuntimeError("Client not initialized (use download_batch or download_single)")
+
+        start_ns = time.perf_counter_ns()
+        file_path = self.storage.get_file_path(emoji1, emoji2)
 
         # Check if already exists
-        if self.skip_existing and self.storage.file_exists(emoji1, emoji2):
+        if self.skip_existing and self.storage.file_exists(emoji1, emoji2, file_path):
             self.stats.skipped += 1
-            self.logger.info(f"Skipped {emoji1} + {emoji2} (already exists)")
+            if self.logger.is_enabled_for(logging.INFO):
+                self.logger.info("Skipped %s + %s (already exists)", emoji1, emoji2)
             return True, None
 
         # Download
-        async with EmojiKitchenClient(
-            delay_ms=self.delay_ms,
-            max_concurrent=self.max_concurrent
-        ) as client:
-            url = client.build_url(emoji1, emoji2, size)
-            success, content, error, status_code = await client.download_image(
-                emoji1, emoji2, size
-            )
+        url = client.build_url(emoji1, emoji2, size)
+        success, content, error, status_code = await client.download_image(
+            emoji1, emoji2, size
+        )
 
-            duration_ms = (time.time() - start_time) * 1000
+        duration_ms = (time.perf_counter_ns() - start_ns) / 1e6
 
-            if success and content:
-                # Save file
-                try:
-                    file_path = self.storage.save(emoji1, emoji2, content)
-                    self.stats.successes += 1
-
-                    # Log success
-                    self.logger.log_success(
-                        emoji1=emoji1,
-                        emoji2=emoji2,
-                        file_path=str(file_path),
-                        duration_ms=duration_ms,
-                        url=url,
-                        status_code=status_code
-                    )
-
-                    return True, None
-
-                except Exception as e:
-                    self.stats.failures += 1
-                    error_msg = f"Failed to save file: {str(e)}"
-
-                    self.logger.log_failure(
-                        emoji1=emoji1,
-                        emoji2=emoji2,
-                        error_type="IOError",
-                        error_message=error_msg,
-                        duration_ms=duration_ms,
-                        url=url
-                    )
-
-                    return False, error_msg
+        if success and content:
+            # Save file
+            try:
+                await self.storage.save_async(emoji1, emoji2, content, file_path)
+                self.stats.successes += 1
 
-            else:
-                # Download failed
-                self.stats.failures += 1
+                # Log success
+                self.logger.log_success(
+                    emoji1=emoji1,
+                    emoji2=emoji2,
+                    file_path=str(file_path),
+                    duration_ms=duration_ms,
+                    url=url,
+                    status_code=status_code
+                )
 
-                error_type = "NetworkError"
-                if status_code == 404:
-                    error_type = "NotFound"
-                elif status_code and status_code >= 500:
-                    error_type = "ServerError"
+                return True, None
+
+            except Exception as e:
+                self.stats.failures += 1
+                error_msg = f"Failed to save file: {str(e)}"
 
                 self.logger.log_failure(
                     emoji1=emoji1,
                     emoji2=emoji2,
-                    error_type=error_type,
-                    error_message=error or "Unknown error",
-                    status_code=status_code,
+                    error_type="IOError",
+                    error_message=error_msg,
                     duration_ms=duration_ms,
                     url=url
                 )
 
-                return False, error
+                return False, error_msg
+
+        else:
+            # Download failed
+            self.stats.failures += 1
+
+            error_type = "NetworkError"
+            if status_code == 404:
+                error_type = "NotFound"
+            elif status_code and status_code >= 500:
+                error_type = "ServerError"
+
+            self.logger.log_failure(
+                emoji1=emoji1,
+                emoji2=emoji2,
+                error_type=error_type,
+                error_message=error or "Unknown error",
+                status_code=status_code,
+                duration_ms=duration_ms,
+                url=url
+            )
+
+            return False, error
+
+    async def _worker(
+        self,
+        queue: asyncio.Queue,
+        size: int,
+        on_done: Optional[Callable[[], None]] = None
+    ) -> None:
+        """
+        Consume emoji pairs from the queue until cancelled.
+
+        Args:
+            queue: Queue of (emoji1, emoji2) tuples
+            size: Image size in pixels
+            on_done: Callback invoked after each pair is processed
+        """
+        while True:
+            emoji1, emoji2 = await queue.get()
+            try:
+                await self.download_pair(emoji1, emoji2, size)
+            except Exception as e:
+                self.logger.error("Unhandled error for %s + %s: %s", emoji1, emoji2, e)
+            finally:
+                queue.task_done()
+                if on_done:
+                    on_done()
+
+    async def _run_workers(
+        self,
+        emoji_pairs: List[Tuple[str, str]],
+        size: int,
+        on_done: Optional[Callable[[], None]] = None
+    ) -> None:
+        """
+        Download pairs with at most max_concurrent in flight.
+
+        Args:
+            emoji_pairs: List of (emoji1, emoji2) tuples
+            size: Image size in pixels
+            on_done: Callback invoked after each pair is processed
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        for pair in emoji_pairs:
+            queue.put_nowait(pair)
+
+        worker_count = max(1, min(self.max_concurrent, len(emoji_pairs)))
+        workers = [
+            asyncio.create_task(self._worker(queue, size, on_done))
+            for _ in range(worker_count)
+        ]
+
+        try:
+            await queue.join()
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
 
     async def download_batch(
         self,
@@ -177,7 +258,10 @@ class DownloadOrchestrator:
         show_progress: bool = True
     ) -> DownloadStats:
         """
-        Download multiple emoji combinations.
+        Download multiple emoji combinations concurrently.
+
+        Up to max_concurrent pairs are in flight at once, pulled from a
+        shared work queue.
 
         Args:
             emoji_pairs: List of (emoji1, emoji2) tuples
@@ -188,44 +272,60 @@ class DownloadOrchestrator:
             DownloadStats with session statistics
         """
         self.stats = DownloadStats(total=len(emoji_pairs))
-        start_time = time.time()
-
-        self.logger.info(f"Starting batch download of {len(emoji_pairs)} combinations")
+        start_time = time.perf_counter()
 
-        if show_progress:
-            progress = create_progress_bar(len(emoji_pairs), "Downloading")
+        try:
+            self.logger.info(f"Starting batch download of {len(emoji_pairs)} combinations")
 
-            with progress:
-                task = progress.add_task("Downloading", total=len(emoji_pairs))
-
-                for emoji1, emoji2 in emoji_pairs:
-                    await self.download_pair(emoji1, emoji2, size)
-                    progress.update(task, advance=1)
-        else:
-            # Download without progress bar
-            for emoji1, emoji2 in emoji_pairs:
-                await self.download_pair(emoji1, emoji2, size)
-
-        self.stats.duration_seconds = time.time() - start_time
-
-        # Print summary
-        print_summary(
-            total=self.stats.total,
-            successes=self.stats.successes,
-            failures=self.stats.failures,
-            skipped=self.stats.skipped,
-            duration_seconds=self.stats.duration_seconds
-        )
-
-        # Print failures if any
-        if self.logger.failures:
-            print_failures(
-                [f.to_dict() for f in self.logger.failures],
-                limit=20
+            async with self._create_client() as client:
+                self._client = client
+                try:
+                    if show_progress:
+                        progress = create_progress_bar(len(emoji_pairs), "Downloading")
+
+                        with progress:
+                            set_progress(progress)
+                            task = progress.add_task("Downloading", total=len(emoji_pairs))
+                            completed = 0
+
+                            def advance() -> None:
+                                # Push to the progress bar in batches
+                                nonlocal completed
+                                completed += 1
+                                if completed % PROGRESS_BATCH == 0:
+                                    progress.update(task, completed=completed)
+
+                            await self._run_workers(emoji_pairs, size, on_done=advance)
+                            progress.update(task, completed=completed)
+                    else:
+                        # Download without progress bar
+                        await self._run_workers(emoji_pairs, size)
+                finally:
+                    self._client = None
+                    set_progress(None)
+
+            self.stats.duration_seconds = time.perf_counter() - start_time
+
+            # Print summary
+            print_summary(
+                total=self.stats.total,
+                successes=self.stats.successes,
+                failures=self.stats.failures,
+                skipped=self.stats.skipped,
+                duration_seconds=self.stats.duration_seconds
             )
 
-        # Save logs
-        self.logger.close()
+            # Print failures if any
+            if self.logger.failures:
+                print_failures(
+                    [f.to_dict() for f in list(self.logger.failures)[-FAILURES_SHOWN:]],
+                    limit=FAILURES_SHOWN,
+                    total=self.logger.failure_count,
+                    most_recent=True
+                )
+        finally:
+            # Flush queued log records even if the run is interrupted
+            self.logger.close()
 
         return self.stats
 
@@ -246,16 +346,23 @@ class DownloadOrchestrator:
         Returns:
             True if successful, False otherwise
         """
-        success, error = await self.download_pair(emoji1, emoji2, size)
-
-        # Print single result summary
-        if self.stats.skipped > 0:
-            print_info(f"File already exists, skipped")
-        elif success:
-            print_info(f"Successfully downloaded to {self.output_dir}")
-        else:
-            print_info(f"Failed: {error}")
-
-        self.logger.close()
+        try:
+            async with self._create_client() as client:
+                self._client = client
+                try:
+                    success, error = await self.download_pair(emoji1, emoji2, size)
+                finally:
+                    self._client = None
+
+            # Print single result summary
+            if self.stats.skipped > 0:
+                print_info(f"File already exists, skipped")
+            elif success:
+                print_info(f"Successfully downloaded to {self.output_dir}")
+            else:
+                print_info(f"Failed: {error}")
+        finally:
+            # Flush queued log records even if the download is interrupted
+            self.logger.close()
 
         return success
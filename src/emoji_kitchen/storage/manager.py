@@ -1,10 +1,43 @@
 """Storage manager for downloading and organizing emoji combination files."""
 
+import asyncio
+import os
+import stat
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, List, Optional
 from .paths import generate_full_path, FilenameFormat
 
 
+@lru_cache(maxsize=20000)
+def _cached_full_path(
+    base_dir: Path,
+    emoji1: str,
+    emoji2: str,
+    filename_format: FilenameFormat
+) -> Path:
+    """Memoized generate_full_path (pairs repeat across skip checks and saves)."""
+    return generate_full_path(base_dir, emoji1, emoji2, filename_format)
+
+
+def _write_file(path: Path, content: bytes) -> None:
+    """
+    Write content to path with raw os calls.
+
+    Skips the buffered io layer (and its extra fstat/isatty syscalls), which
+    is pure overhead for a single write of an in-memory image.
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+    fd = os.open(path, flags, 0o666)
+    try:
+        view = memoryview(content)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+
 class StorageManager:
     """
     Manages file storage for emoji combination images.
@@ -19,7 +52,8 @@ class StorageManager:
     def __init__(
         self,
         base_dir: Path,
-        filename_format: FilenameFormat = 'auto'
+        filename_format: FilenameFormat = 'auto',
+        symmetric: bool = False
     ):
         """
         Initialize storage manager.
@@ -27,13 +61,35 @@ class StorageManager:
         Args:
             base_dir: Base directory for downloads
             filename_format: Filename format ('emoji', 'codepoint', or 'auto')
+            symmetric: Treat (A, B) and (B, A) as the same file, stored
+                       under codepoint order
         """
         self.base_dir = Path(base_dir)
         self.filename_format = filename_format
+        self.symmetric = symmetric
 
         # Create base directory
         self.base_dir.mkdir(parents=True, exist_ok=True)
 
+        # Directories known to exist (skips a mkdir per save)
+        self._dir_cache: set[Path] = set()
+
+    def _ensure_directory(self, directory: Path) -> None:
+        """Create directory once per session."""
+        if directory not in self._dir_cache:
+            directory.mkdir(parents=True, exist_ok=True)
+            self._dir_cache.add(directory)
+
+    def prewarm_directories(self, emojis: Iterable[str]) -> None:
+        """
+        Create base emoji directories up front.
+
+        Args:
+            emojis: Base emojis that will be saved under
+        """
+        for emoji in set(emojis):
+            self._ensure_directory(self.get_emoji_directory(emoji))
+
     def get_file_path(self, emoji1: str, emoji2: str) -> Path:
         """
         Get file path for emoji combination.
@@ -45,32 +101,49 @@ class StorageManager:
         Returns:
             Path object for the file
         """
-        return generate_full_path(
+        # String comparison orders by codepoint
+        if self.symmetric and emoji2 < emoji1:
+            emoji1, emoji2 = emoji2, emoji1
+
+        return _cached_full_path(
             self.base_dir,
             emoji1,
             emoji2,
             self.filename_format
         )
 
-    def file_exists(self, emoji1: str, emoji2: str) -> bool:
+    def file_exists(
+        self,
+        emoji1: str,
+        emoji2: str,
+        path: Optional[Path] = None
+    ) -> bool:
         """
         Check if file already exists.
 
         Args:
             emoji1: First emoji
             emoji2: Second emoji
+            path: Precomputed path from get_file_path (computed if None)
 
         Returns:
             True if file exists, False otherwise
         """
-        path = self.get_file_path(emoji1, emoji2)
-        return path.exists() and path.is_file()
+        if path is None:
+            path = self.get_file_path(emoji1, emoji2)
+
+        # Single stat call (exists() + is_file() would stat twice)
+        try:
+            return stat.S_ISREG(os.stat(path).st_mode)
+        except (FileNotFoundError, NotADirectoryError):
+            return False
 
     def save(
         self,
         emoji1: str,
         emoji2: str,
-        content: bytes
+        content: bytes,
+        path: Optional[Path] = None
     ) -> Path:
         """
         Save emoji combination image to disk.
@@ -79,6 +152,7 @@ class StorageManager:
             emoji1: First emoji
             emoji2: Second emoji
             content: Image binary content
+            path: Precomputed path from get_file_path (computed if None)
 
         Returns:
             Path where file was saved
@@ -86,13 +160,38 @@ class StorageManager:
         Raises:
             IOError: If file cannot be written
         """
-        file_path = self.get_file_path(emoji1, emoji2)
+        file_path = path if path is not None else self.get_file_path(emoji1, emoji2)
 
         # Create parent directory if it doesn't exist
-        file_path.parent.mkdir(parents=True, exist_ok=True)
+        self._ensure_directory(file_path.parent)
 
         # Write file
-        file_path.write_bytes(content)
+        _write_file(file_path, content)
+
+        return file_path
+
+    async def save_async(
+        self,
+        emoji1: str,
+        emoji2: str,
+        content: bytes,
+        path: Optional[Path] = None
+    ) -> Path:
+        """
+        Save emoji combination image without blocking the event loop.
+
+        The file write runs in a worker thread; see save() for arguments.
+
+        Returns:
+            Path where file was saved
+
+        Raises:
+            IOError: If file cannot be written
+        """
+        file_path = path if path is not None else self.get_file_path(emoji1, emoji2)
+        self._ensure_directory(file_path.parent)
+
+        await asyncio.to_thread(_write_file, file_path, content)
 
         return file_path
 
@@ -154,10 +253,20 @@ class StorageManager:
         Returns:
             Number of files
         """
-        if emoji:
-            directory = self.get_emoji_directory(emoji)
-            if directory.exists():
-                return len(list(directory.glob('*.png')))
-            return 0
-        else:
-            return len(list(self.base_dir.rglob('*.png')))
+        root = self.get_emoji_directory(emoji) if emoji else self.base_dir
+
+        # Walk with os.scandir and a running counter instead of building
+        # a Path list just to take its length
+        count = 0
+        stack: List[str] = [os.fspath(root)]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.name.endswith('.png'):
+                            count += 1
+            except (FileNotFoundError, NotADirectoryError):
+                pass
+        return count
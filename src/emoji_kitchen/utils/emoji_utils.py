@@ -1,10 +1,12 @@
 """Emoji utility functions for conversion and validation."""
 
 import unicodedata
+from functools import lru_cache
 from typing import Optional
 import emoji as emoji_lib
 
 
+@lru_cache(maxsize=1024)
 def emoji_to_codepoint(emoji_char: str) -> str:
     """
     Convert emoji to hex codepoint string.
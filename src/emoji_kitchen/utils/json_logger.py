@@ -1,15 +1,141 @@
 """JSON logging suite for tracking download successes and failures."""
 
+import atexit
 import json
 import logging
+import logging.handlers
+import math
+import operator
+import os
+import queue
+import threading
+import time
+from collections import Counter, deque
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional, List
-from dataclasses import dataclass, asdict
+from typing import Deque, Dict, Any, Optional, List, get_type_hints
+from dataclasses import dataclass, fields
+from json.encoder import encode_basestring
 import sys
 
+try:
+    import orjson  # type: ignore[import-not-found]  # Optional: much faster encoding of result records
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
-@dataclass
+try:
+    import msgspec  # type: ignore[import-not-found]  # Optional: fastest encoding of result records
+except ImportError:
+    msgspec = None  # type: ignore[assignment]
+
+
+# Lazy %-style templates: only formatted if the message is emitted
+_SUCCESS_TEMPLATE = "SUCCESS: %s + %s -> %s"
+_SUCCESS_TIMED_TEMPLATE = _SUCCESS_TEMPLATE + " (%.0fms)"
+_FAILURE_TEMPLATE = "FAILURE: %s + %s - %s: %s"
+_FAILURE_HTTP_TEMPLATE = _FAILURE_TEMPLATE + " [HTTP %s]"
+
+
+@lru_cache(maxsize=1)
+def _iso_second(seconds: int) -> str:
+    """ISO local time for a whole second (records in the same second share it)."""
+    return datetime.fromtimestamp(seconds).isoformat()
+
+
+def _timestamp() -> str:
+    """Current local time in ISO format, without a datetime per call."""
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    return f"{_iso_second(seconds)}.{nanos // 1000:06d}"
+
+
+class _BufferedFileHandler(logging.FileHandler):
+    """
+    FileHandler that lets the file buffer batch writes.
+
+    StreamHandler flushes after every record, which costs a write() per log
+    line. Here the stream is flushed only for records at or above
+    flush_level, and when the handler is closed.
+    """
+
+    def __init__(
+        self,
+        filename: Path,
+        buffer_size: int = 64 * 1024,
+        flush_level: int = logging.ERROR,
+        encoding: Optional[str] = None
+    ):
+        self.buffer_size = buffer_size
+        self.flush_level = flush_level
+        super().__init__(filename, encoding=encoding)
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                    encoding=self.encoding, errors=self.errors)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= self.flush_level:
+                self.stream.flush()
+        except Exception:
+            self.handleError(record)
+
+
+def _dumps(obj: Any) -> bytes:
+    """Encode obj as compact UTF-8 JSON bytes, using orjson when available."""
+    if orjson:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+# Record separator for the JSON Lines files
+_NEWLINE = b'\n'
+
+# Most buffers a single writev() call accepts
+try:
+    _IOV_MAX = os.sysconf('SC_IOV_MAX')
+except (AttributeError, ValueError, OSError):
+    _IOV_MAX = 1024
+if _IOV_MAX <= 0:
+    # sysconf returns -1 when the limit is indeterminate
+    _IOV_MAX = 1024
+
+
+def _write_pieces(fd: int, pieces: List[bytes]) -> None:
+    """
+    Append a batch of byte strings to fd without joining them first.
+
+    Uses scatter-gather os.writev() where available, so the batch is not
+    copied into one buffer; falls back to a single joined write elsewhere.
+    """
+    if not hasattr(os, 'writev'):
+        view = memoryview(b''.join(pieces))
+        while view:
+            view = view[os.write(fd, view):]
+        return
+
+    for start in range(0, len(pieces), _IOV_MAX):
+        chunk = pieces[start:start + _IOV_MAX]
+        written = os.writev(fd, chunk)
+        expected = sum(map(len, chunk))
+        if written < expected:
+            # Short write (rare for regular files): finish the remainder
+            view = memoryview(b''.join(chunk))[written:]
+            while view:
+                view = view[os.write(fd, view):]
+
+
+def _dumps_line(record: Dict[str, Any]) -> bytes:
+    """Encode a result record as one newline-terminated JSON Lines record."""
+    if orjson:
+        return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+    return _encode_result_line(record)
+
+
+@dataclass(slots=True)
 class DownloadResult:
     """Record of a single download attempt."""
 
@@ -25,8 +151,65 @@ class DownloadResult:
     url: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization."""
-        return asdict(self)
+        """Convert to dictionary for JSON serialization (fields are scalars, no deep copy)."""
+        return {
+            'emoji1': self.emoji1,
+            'emoji2': self.emoji2,
+            'timestamp': self.timestamp,
+            'success': self.success,
+            'file_path': self.file_path,
+            'error_type': self.error_type,
+            'error_message': self.error_message,
+            'status_code': self.status_code,
+            'duration_ms': self.duration_ms,
+            'url': self.url,
+        }
+
+
+# JSON expression for each field type, as f-string source ({0} is the value)
+_FIELD_ENCODERS = {
+    str: '_encode_str({0})',
+    bool: '"true" if {0} else "false"',
+    Optional[str]: '"null" if {0} is None else _encode_str({0})',
+    Optional[int]: '"null" if {0} is None else repr({0})',
+    # repr() matches json.dumps for finite floats; json spells nan/inf as NaN/Infinity
+    Optional[float]: '"null" if {0} is None else repr({0}) if _isfinite({0}) else _encode_any({0})',
+}
+
+
+def _build_result_line_encoder():
+    """
+    Generate a JSON Lines encoder specialized to the DownloadResult layout.
+
+    Every record has the same keys in the same order, so the keys are
+    pre-encoded into a single f-string and each value gets an inline
+    expression for its declared type. This is what the stdlib fallback uses
+    instead of walking each record with json.dumps.
+    """
+    hints = get_type_hints(DownloadResult)
+    names = [field.name for field in fields(DownloadResult)]
+
+    parts = []
+    for name in names:
+        value = _FIELD_ENCODERS.get(hints[name], '_encode_any({0})').format(name)
+        parts.append(f'{encode_basestring(name)}:{{{value}}}')
+
+    source = (
+        'def _encode_result_line(record):\n'
+        f'    {", ".join(names)} = _result_values(record)\n'
+        f"    return f'{{{{{','.join(parts)}}}}}\\n'.encode('utf-8')\n"
+    )
+    namespace = {
+        '_result_values': operator.itemgetter(*names),
+        '_encode_str': encode_basestring,
+        '_encode_any': json.dumps,
+        '_isfinite': math.isfinite,
+    }
+    exec(compile(source, '<json_logger result encoder>', 'exec'), namespace)
+    return namespace['_encode_result_line']
+
+
+_encode_result_line = _build_result_line_encoder()
 
 
 class JSONLogger:
@@ -34,12 +217,22 @@ class JSONLogger:
     Comprehensive JSON logging system with separate success/failure tracking.
 
     Features:
-    - Separate JSON files for successes and failures
+    - Separate JSON Lines files for successes and failures
     - Regular Python logging for debugging
     - Session-based organization
-    - Real-time file updates
+    - Background writer thread (callers only enqueue; no disk IO on the hot path)
+    - Safe to share: log_success/log_failure never block on IO, so they can be
+      called directly from coroutines or from multiple threads
+    - Constant memory: counters plus a bounded recent-failures buffer
     """
 
+    # Most recent failures kept in memory for end-of-session reporting
+    RECENT_FAILURES_LIMIT = 200
+
+    # Writer thread flushes a file's buffer at this size or age
+    FLUSH_BYTES = 64 * 1024
+    FLUSH_INTERVAL = 0.2
+
     def __init__(
         self,
         log_dir: Path,
@@ -64,29 +257,36 @@ class JSONLogger:
             session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
         self.session_id = session_id
 
-        # Define log file paths
-        self.success_file = self.log_dir / f"successes_{self.session_id}.json"
-        self.failure_file = self.log_dir / f"failures_{self.session_id}.json"
+        # Define log file paths (JSON Lines: one record per line, append-only)
+        self.success_file = self.log_dir / f"successes_{self.session_id}.jsonl"
+        self.failure_file = self.log_dir / f"failures_{self.session_id}.jsonl"
         self.debug_file = self.log_dir / f"debug_{self.session_id}.log"
 
-        # Initialize JSON files with empty lists
-        self._init_json_file(self.success_file)
-        self._init_json_file(self.failure_file)
+        # Create the result files and keep them open in append mode for the
+        # session; O_APPEND keeps each write atomic at the end of the file
+        flags = os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, 'O_BINARY', 0)
+        self._fds: Dict[Path, int] = {
+            self.success_file: os.open(self.success_file, flags, 0o666),
+            self.failure_file: os.open(self.failure_file, flags, 0o666),
+        }
 
         # Set up Python logger for debugging
         self.logger = logging.getLogger(f"emoji_kitchen_{session_id}")
         self.logger.setLevel(log_level)
         self.logger.handlers.clear()  # Clear any existing handlers
 
+        # Handlers run on a QueueListener thread; the logger only enqueues
+        self._handlers: List[logging.Handler] = []
+
         # File handler for debug logs
-        file_handler = logging.FileHandler(self.debug_file, encoding='utf-8')
+        file_handler = _BufferedFileHandler(self.debug_file, encoding='utf-8')
         file_handler.setLevel(logging.DEBUG)
         file_formatter = logging.Formatter(
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         file_handler.setFormatter(file_formatter)
-        self.logger.addHandler(file_handler)
+        self._handlers.append(file_handler)
 
         # Console handler (optional)
         if enable_console:
@@ -94,39 +294,106 @@ class JSONLogger:
             console_handler.setLevel(log_level)
             console_formatter = logging.Formatter('%(levelname)s: %(message)s')
             console_handler.setFormatter(console_formatter)
-            self.logger.addHandler(console_handler)
+            self._handlers.append(console_handler)
+
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self.logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        self._listener = logging.handlers.QueueListener(
+            log_queue,
+            *self._handlers,
+            respect_handler_level=True
+        )
+        self._listener.start()
+
+        # Result records are written by a background thread
+        self._closed = False
+        self._write_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._writer = threading.Thread(
+            target=self._writer_loop,
+            name=f"json-logger-{self.session_id}",
+            daemon=True
+        )
+        self._writer.start()
+
+        # Recent failures for end-of-session reporting (full history is on disk)
+        self.failures: Deque[DownloadResult] = deque(maxlen=self.RECENT_FAILURES_LIMIT)
 
-        # In-memory storage for session summary
-        self.successes: List[DownloadResult] = []
-        self.failures: List[DownloadResult] = []
+        # Running totals for the session summary (guarded by _stats_lock;
+        # += on an attribute is not atomic across threads). The lock also
+        # covers the closed check and enqueue in log_*, and close()
+        self._stats_lock = threading.Lock()
+        self.success_count = 0
+        self.failure_count = 0
+        self.error_breakdown: Counter[str] = Counter()
 
         self.logger.info(f"JSON Logger initialized - Session: {self.session_id}")
         self.logger.info(f"Success log: {self.success_file}")
         self.logger.info(f"Failure log: {self.failure_file}")
         self.logger.info(f"Debug log: {self.debug_file}")
 
-    def _init_json_file(self, file_path: Path) -> None:
-        """Initialize JSON file with empty array."""
-        if not file_path.exists():
-            with file_path.open('w', encoding='utf-8') as f:
-                json.dump([], f)
-
-    def _append_to_json_file(self, file_path: Path, result: DownloadResult) -> None:
-        """Append a result to JSON file."""
-        try:
-            # Read existing data
-            with file_path.open('r', encoding='utf-8') as f:
-                data = json.load(f)
-
-            # Append new result
-            data.append(result.to_dict())
-
-            # Write back
-            with file_path.open('w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-
-        except Exception as e:
-            self.logger.error(f"Failed to write to {file_path}: {e}")
+        # Both threads are daemons, so make sure queued records are flushed
+        # at interpreter exit even if the owner never calls close()
+        atexit.register(self.close)
+
+    # Queued after the last record to stop the writer thread
+    _STOP = object()
+
+    def _writer_loop(self) -> None:
+        """Collect queued results per file and append them in batches."""
+        buffers: Dict[Path, List[bytes]] = {}
+        pending = 0
+        last_flush = time.monotonic()
+        encoder = msgspec.json.Encoder() if msgspec else None
+
+        while True:
+            # Block indefinitely when idle; otherwise wake up for the next flush
+            timeout = None
+            if buffers:
+                timeout = max(0.0, self.FLUSH_INTERVAL - (time.monotonic() - last_flush))
+
+            try:
+                item = self._write_queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            if item is self._STOP:
+                self._flush_buffers(buffers)
+                return
+
+            if item is not None:
+                file_path, record = item
+                try:
+                    line = encoder.encode(record) if encoder else _dumps_line(record)
+                except Exception as e:
+                    # Drop just this record; the writer must keep running
+                    self.logger.error("Failed to encode record for %s: %s", file_path, e)
+                    continue
+
+                pieces = buffers.setdefault(file_path, [])
+                pieces.append(line)
+                pending += len(line)
+                if encoder:
+                    pieces.append(_NEWLINE)
+                    pending += 1
+
+                if (pending < self.FLUSH_BYTES
+                        and time.monotonic() - last_flush < self.FLUSH_INTERVAL):
+                    continue
+
+            self._flush_buffers(buffers)
+            pending = 0
+            last_flush = time.monotonic()
+
+    def _flush_buffers(self, buffers: Dict[Path, List[bytes]]) -> None:
+        """Append each batch of records to its JSON Lines file and clear buffers."""
+        for file_path, pieces in buffers.items():
+            try:
+                _write_pieces(self._fds[file_path], pieces)
+
+            except Exception as e:
+                self.logger.error(f"Failed to write to {file_path}: {e}")
+
+        buffers.clear()
 
     def log_success(
         self,
@@ -135,7 +402,7 @@ class JSONLogger:
         file_path: str,
         duration_ms: Optional[float] = None,
         url: Optional[str] = None,
-        status_code: int = 200
+        status_code: Optional[int] = 200
     ) -> None:
         """
         Log a successful download.
@@ -147,25 +414,38 @@ class JSONLogger:
             duration_ms: Download duration in milliseconds
             url: Download URL
             status_code: HTTP status code
+
+        Raises:
+            RuntimeError: If the logger has already been closed
         """
-        result = DownloadResult(
-            emoji1=emoji1,
-            emoji2=emoji2,
-            timestamp=datetime.now().isoformat(),
-            success=True,
-            file_path=file_path,
-            status_code=status_code,
-            duration_ms=duration_ms,
-            url=url
-        )
+        # Successes aren't kept in memory, so build the record dict directly
+        # (same keys as DownloadResult.to_dict) instead of a DownloadResult
+        record = {
+            'emoji1': emoji1,
+            'emoji2': emoji2,
+            'timestamp': _timestamp(),
+            'success': True,
+            'file_path': file_path,
+            'error_type': None,
+            'error_message': None,
+            'status_code': status_code,
+            'duration_ms': duration_ms,
+            'url': url,
+        }
 
-        self.successes.append(result)
-        self._append_to_json_file(self.success_file, result)
+        with self._stats_lock:
+            if self._closed:
+                raise RuntimeError(f"JSONLogger session {self.session_id} is closed")
+            self.success_count += 1
+            self._write_queue.put((self.success_file, record))
 
-        self.logger.info(
-            f"SUCCESS: {emoji1} + {emoji2}  {file_path} "
-            f"({duration_ms:.0f}ms)" if duration_ms else ""
-        )
+        if self.logger.isEnabledFor(logging.INFO):
+            if duration_ms is not None:
+                self.logger.info(
+                    _SUCCESS_TIMED_TEMPLATE, emoji1, emoji2, file_path, duration_ms
+                )
+            else:
+                self.logger.info(_SUCCESS_TEMPLATE, emoji1, emoji2, file_path)
 
     def log_failure(
         self,
@@ -188,11 +468,14 @@ class JSONLogger:
             status_code: HTTP status code (if applicable)
             duration_ms: Attempt duration in milliseconds
             url: Download URL
+
+        Raises:
+            RuntimeError: If the logger has already been closed
         """
         result = DownloadResult(
             emoji1=emoji1,
             emoji2=emoji2,
-            timestamp=datetime.now().isoformat(),
+            timestamp=_timestamp(),
             success=False,
             error_type=error_type,
             error_message=error_message,
@@ -201,29 +484,43 @@ class JSONLogger:
             url=url
         )
 
-        self.failures.append(result)
-        self._append_to_json_file(self.failure_file, result)
-
-        self.logger.warning(
-            f"FAILURE: {emoji1} + {emoji2} - {error_type}: {error_message} "
-            f"[HTTP {status_code}]" if status_code else ""
-        )
-
-    def debug(self, message: str) -> None:
-        """Log debug message."""
-        self.logger.debug(message)
-
-    def info(self, message: str) -> None:
-        """Log info message."""
-        self.logger.info(message)
-
-    def warning(self, message: str) -> None:
-        """Log warning message."""
-        self.logger.warning(message)
-
-    def error(self, message: str) -> None:
-        """Log error message."""
-        self.logger.error(message)
+        with self._stats_lock:
+            if self._closed:
+                raise RuntimeError(f"JSONLogger session {self.session_id} is closed")
+            self.failures.append(result)
+            self.failure_count += 1
+            self.error_breakdown[error_type or 'Unknown'] += 1
+            self._write_queue.put((self.failure_file, result.to_dict()))
+
+        if self.logger.isEnabledFor(logging.WARNING):
+            if status_code is not None:
+                self.logger.warning(
+                    _FAILURE_HTTP_TEMPLATE, emoji1, emoji2, error_type, error_message, status_code
+                )
+            else:
+                self.logger.warning(
+                    _FAILURE_TEMPLATE, emoji1, emoji2, error_type, error_message
+                )
+
+    def is_enabled_for(self, level: int) -> bool:
+        """Check whether messages at level would be emitted (skip formatting if not)."""
+        return self.logger.isEnabledFor(level)
+
+    def debug(self, message: str, *args: Any) -> None:
+        """Log debug message (%-style args are formatted only if emitted)."""
+        self.logger.debug(message, *args)
+
+    def info(self, message: str, *args: Any) -> None:
+        """Log info message (%-style args are formatted only if emitted)."""
+        self.logger.info(message, *args)
+
+    def warning(self, message: str, *args: Any) -> None:
+        """Log warning message (%-style args are formatted only if emitted)."""
+        self.logger.warning(message, *args)
+
+    def error(self, message: str, *args: Any) -> None:
+        """Log error message (%-style args are formatted only if emitted)."""
+        self.logger.error(message, *args)
 
     def get_summary(self) -> Dict[str, Any]:
         """
@@ -232,9 +529,9 @@ class JSONLogger:
         Returns:
             Dictionary with success/failure counts and rates
         """
-        total = len(self.successes) + len(self.failures)
-        success_count = len(self.successes)
-        failure_count = len(self.failures)
+        success_count = self.success_count
+        failure_count = self.failure_count
+        total = success_count + failure_count
 
         success_rate = (success_count / total * 100) if total > 0 else 0.0
 
@@ -255,19 +552,29 @@ class JSONLogger:
         summary = self.get_summary()
 
         # Add breakdown by error type
-        error_breakdown: Dict[str, int] = {}
-        for failure in self.failures:
-            error_type = failure.error_type or 'Unknown'
-            error_breakdown[error_type] = error_breakdown.get(error_type, 0) + 1
-
-        summary['error_breakdown'] = error_breakdown
+        summary['error_breakdown'] = dict(self.error_breakdown)
 
-        with summary_file.open('w', encoding='utf-8') as f:
-            json.dump(summary, f, indent=2, ensure_ascii=False)
+        summary_file.write_bytes(_dumps(summary))
 
         self.logger.info(f"Summary saved to {summary_file}")
 
     def close(self) -> None:
-        """Close logger and save final summary."""
+        """Flush queued records, save final summary, and stop background threads."""
+        # Under the lock so no record can be queued behind _STOP
+        with self._stats_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._write_queue.put(self._STOP)
+        atexit.unregister(self.close)
+
+        self._writer.join()
+        for fd in self._fds.values():
+            os.close(fd)
+
         self.save_summary()
         self.logger.info("JSON Logger closed")
+
+        self._listener.stop()
+        for handler in self._handlers:
+            handler.close()
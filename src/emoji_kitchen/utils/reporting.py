@@ -1,6 +1,6 @@
 """Reporting utilities for displaying download results and statistics."""
 
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
@@ -9,6 +9,14 @@ from rich.text import Text
 
 console = Console()
 
+# Completions per progress bar refresh
+PROGRESS_BATCH = 25
+
+# Progress display that per-download messages print through, if any.
+# Messages are built as Text rather than markup, so Rich never has to parse
+# them (and emoji or error text can't be misread as markup tags).
+_progress = None
+
 
 def print_summary(
     total: int,
@@ -27,7 +35,9 @@ def print_summary(
         skipped: Skipped (already exist)
         duration_seconds: Total duration in seconds
     """
-    success_rate = (successes / total * 100) if total > 0 else 0.0
+    # Scale once; every percentage below is a single multiply
+    pct = 100.0 / total if total > 0 else 0.0
+    success_rate = successes * pct
 
     # Create summary table
     table = Table(title="Download Summary", show_header=True, header_style="bold magenta")
@@ -44,12 +54,10 @@ def print_summary(
     )
 
     if skipped > 0:
-        skip_rate = (skipped / total * 100) if total > 0 else 0.0
-        table.add_row("Skipped (Exist)", str(skipped), f"{skip_rate:.1f}%", style="blue")
+        table.add_row("Skipped (Exist)", str(skipped), f"{skipped * pct:.1f}%", style="blue")
 
     if failures > 0:
-        failure_rate = (failures / total * 100) if total > 0 else 0.0
-        table.add_row("Failures", str(failures), f"{failure_rate:.1f}%", style="bold red")
+        table.add_row("Failures", str(failures), f"{failures * pct:.1f}%", style="bold red")
 
     console.print(table)
 
@@ -60,18 +68,36 @@ def print_summary(
         console.print(f"[bold]Duration:[/bold] {duration_seconds:.1f} seconds")
 
 
-def print_failures(failures: List[Dict[str, Any]], limit: int = 10) -> None:
+def print_failures(
+    failures: List[Dict[str, Any]],
+    limit: int = 10,
+    total: Optional[int] = None,
+    most_recent: bool = False
+) -> None:
     """
     Print table of failed downloads.
 
     Args:
         failures: List of failure dictionaries
         limit: Maximum number of failures to display
+        total: Total failure count, if failures holds only a subset
+        most_recent: Show the last `limit` failures instead of the first
     """
     if not failures:
         return
 
-    console.print(f"\n[bold red]Failed Downloads ({len(failures)} total):[/bold red]")
+    count = len(failures)
+    if total is None:
+        total = count
+
+    shown = min(limit, count)
+    if most_recent and total > shown:
+        console.print(
+            f"\n[bold red]Failed Downloads ({total} total, "
+            f"most recent {shown} shown):[/bold red]"
+        )
+    else:
+        console.print(f"\n[bold red]Failed Downloads ({total} total):[/bold red]")
 
     # Create failures table
     table = Table(show_header=True, header_style="bold red")
@@ -79,7 +105,7 @@ def print_failures(failures: List[Dict[str, Any]], limit: int = 10) -> None:
     table.add_column("Error Type", style="yellow")
     table.add_column("Details", style="white")
 
-    for failure in failures[:limit]:
+    for failure in (failures[-limit:] if most_recent else failures[:limit]):
         emoji1 = failure.get('emoji1', '?')
         emoji2 = failure.get('emoji2', '?')
         error_type = failure.get('error_type', 'Unknown')
@@ -93,23 +119,40 @@ def print_failures(failures: List[Dict[str, Any]], limit: int = 10) -> None:
 
     console.print(table)
 
-    if len(failures) > limit:
-        console.print(f"\n[dim]... and {len(failures) - limit} more failures[/dim]")
+    if total > shown:
+        which = "earlier" if most_recent else "more"
+        console.print(f"\n[dim]... and {total - shown} {which} failures[/dim]")
+
+
+def set_progress(progress) -> None:
+    """
+    Route per-download messages through a live progress display.
+
+    Args:
+        progress: Active Rich Progress, or None to print straight to the console
+    """
+    global _progress
+    _progress = progress
+
+
+def _print_item(message: Text) -> None:
+    """Print a per-download message, above the progress bar if one is live."""
+    (_progress.console if _progress is not None else console).print(message)
 
 
 def print_success_message(emoji1: str, emoji2: str, file_path: str) -> None:
     """Print success message for single download."""
-    console.print(f"[green][/green] Downloaded {emoji1} + {emoji2}  {file_path}")
+    _print_item(Text.assemble(("", "green"), f" Downloaded {emoji1} + {emoji2}  {file_path}"))
 
 
 def print_error_message(emoji1: str, emoji2: str, error: str) -> None:
     """Print error message for single download."""
-    console.print(f"[red][/red] Failed {emoji1} + {emoji2}: {error}")
+    _print_item(Text.assemble(("", "red"), f" Failed {emoji1} + {emoji2}: {error}"))
 
 
 def print_skip_message(emoji1: str, emoji2: str) -> None:
     """Print skip message for existing file."""
-    console.print(f"[blue][/blue] Skipped {emoji1} + {emoji2} (already exists)")
+    _print_item(Text.assemble(("", "blue"), f" Skipped {emoji1} + {emoji2} (already exists)"))
 
 
 def print_header(title: str) -> None:
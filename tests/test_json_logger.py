@@ -0,0 +1,168 @@
+"""Tests for the JSON logger's result encoding and background writer."""
+
+import json
+import math
+import os
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from src.emoji_kitchen.utils import json_logger
+from src.emoji_kitchen.utils.json_logger import DownloadResult, JSONLogger, _encode_result_line
+
+
+def _reference_line(record):
+    """What compact json.dumps writes for a record, as one JSON line."""
+    return (json.dumps(record, separators=(',', ':'), ensure_ascii=False) + '\n').encode('utf-8')
+
+
+RECORDS = [
+    DownloadResult(
+        emoji1="😀", emoji2="🔥", timestamp="2026-01-01T12:00:00.000001", success=True,
+        file_path="out/😀/😀_🔥.png", status_code=200, duration_ms=12.5,
+        url="https://www.gstatic.com/android/keyboard/emojikitchen/x.png"
+    ),
+    DownloadResult(
+        emoji1="👨‍💻", emoji2="🐶", timestamp="2026-01-01T12:00:00.000002", success=False,
+        error_type="NotFound", error_message="Combination not found", status_code=404
+    ),
+    DownloadResult(
+        emoji1='"quoted"', emoji2="back\\slash", timestamp="t", success=False,
+        error_type=None, error_message="line\nbreak\ttab\x01control é", duration_ms=3
+    ),
+    DownloadResult(emoji1="a", emoji2="b", timestamp="t", success=True, duration_ms=0.1 + 0.2),
+    DownloadResult(emoji1="a", emoji2="b", timestamp="t", success=True, duration_ms=1e-7),
+]
+
+
+@pytest.mark.parametrize("result", RECORDS)
+def test_matches_json_dumps(result):
+    record = result.to_dict()
+    line = _encode_result_line(record)
+
+    assert line == _reference_line(record)
+    assert json.loads(line) == record
+
+
+@pytest.mark.parametrize("value", [math.nan, math.inf, -math.inf])
+def test_non_finite_duration_matches_json_dumps(value):
+    record = DownloadResult(
+        emoji1="a", emoji2="b", timestamp="t", success=True, duration_ms=value
+    ).to_dict()
+
+    assert _encode_result_line(record) == _reference_line(record)
+
+
+def _read_lines(path):
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+
+def test_unencodable_record_does_not_stop_writer(tmp_path):
+    logger = JSONLogger(tmp_path, session_id="s", enable_console=False)
+
+    logger.log_success("a", "b", file_path=Path("bad.png"))
+    logger.log_success("a", "b", file_path="good.png")
+    logger.close()
+
+    assert [r['file_path'] for r in _read_lines(logger.success_file)] == ["good.png"]
+    assert "Failed to encode record" in logger.debug_file.read_text(encoding='utf-8')
+
+
+
+def test_close_waits_for_in_flight_record(tmp_path):
+    logger = JSONLogger(tmp_path, session_id="s", enable_console=False)
+    real_queue = logger._write_queue
+    closer = threading.Thread(target=logger.close)
+
+    class ClosingQueue:
+        """Starts close() while log_success is between its check and its put."""
+
+        def put(self, item):
+            if item is not logger._STOP:
+                closer.start()
+                time.sleep(0.05)
+            real_queue.put(item)
+
+        def get(self, *args, **kwargs):
+            return real_queue.get(*args, **kwargs)
+
+    logger._write_queue = ClosingQueue()
+    logger.log_success("a", "b", file_path="x.png")
+    closer.join()
+
+    assert len(_read_lines(logger.success_file)) == logger.success_count == 1
+    with pytest.raises(RuntimeError):
+        logger.log_failure("a", "b", "NotFound", "gone")
+
+
+def _wait_for_lines(path, count, timeout=5.0):
+    """Poll until the writer thread has appended count lines to path."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        lines = _read_lines(path)
+        if len(lines) >= count:
+            return lines
+        time.sleep(0.01)
+    return _read_lines(path)
+
+
+def test_batched_records_keep_order_per_file(tmp_path):
+    logger = JSONLogger(tmp_path, session_id="s", enable_console=False)
+    logger.FLUSH_BYTES = 512  # several batches, not one flush at close
+
+    for i in range(300):
+        logger.log_success(str(i), "s", file_path=f"{i}.png")
+        if i % 3 == 0:
+            logger.log_failure(str(i), "f", "NotFound", "gone", status_code=404)
+    logger.close()
+
+    assert [r['emoji1'] for r in _read_lines(logger.success_file)] == [
+        str(i) for i in range(300)
+    ]
+    assert [r['emoji1'] for r in _read_lines(logger.failure_file)] == [
+        str(i) for i in range(0, 300, 3)
+    ]
+
+
+def test_flushes_when_batch_reaches_flush_bytes(tmp_path):
+    logger = JSONLogger(tmp_path, session_id="s", enable_console=False)
+    logger.FLUSH_BYTES = 1
+    logger.FLUSH_INTERVAL = 3600
+
+    logger.log_success("a", "b", file_path="x.png")
+    try:
+        assert len(_wait_for_lines(logger.success_file, 1)) == 1
+    finally:
+        logger.close()
+
+
+def test_flushes_after_flush_interval(tmp_path):
+    logger = JSONLogger(tmp_path, session_id="s", enable_console=False)
+    logger.FLUSH_BYTES = 1 << 30
+    logger.FLUSH_INTERVAL = 0.05
+
+    logger.log_success("a", "b", file_path="x.png")
+    try:
+        assert len(_wait_for_lines(logger.success_file, 1)) == 1
+    finally:
+        logger.close()
+
+
+@pytest.mark.parametrize('has_writev', [True, False])
+def test_write_pieces_across_iov_max(tmp_path, monkeypatch, has_writev):
+    monkeypatch.setattr(json_logger, '_IOV_MAX', 3)
+    if not has_writev:
+        monkeypatch.delattr(os, 'writev', raising=False)
+    pieces = [f"{i}\n".encode() for i in range(10)]
+
+    path = tmp_path / "out"
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND)
+    try:
+        json_logger._write_pieces(fd, pieces)
+    finally:
+        os.close(fd)
+
+    assert path.read_bytes() == b''.join(pieces)
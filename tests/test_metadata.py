@@ -0,0 +1,86 @@
+"""Tests for the metadata combination index."""
+
+import json
+
+import pytest
+
+from src.emoji_kitchen.api.metadata import MetadataManager
+
+
+def _record(left, left_code, right, right_code):
+    return {
+        'leftEmoji': left,
+        'leftEmojiCodepoint': left_code,
+        'rightEmoji': right,
+        'rightEmojiCodepoint': right_code,
+    }
+
+
+# Same shape as the upstream metadata.json: '-' joiners, fe0f kept
+METADATA = {
+    'data': {
+        '1f600': {
+            'combinations': {
+                '2764-fe0f': [_record('😀', '1f600', '❤️', '2764-fe0f')],
+                '1f43b-200d-2744-fe0f': [
+                    _record('🐻‍❄️', '1f43b-200d-2744-fe0f', '😀', '1f600')
+                ],
+            }
+        },
+        '1f525': {
+            'combinations': {
+                '1f525': [_record('🔥', '1f525', '🔥', '1f525')],
+            }
+        },
+    }
+}
+
+
+@pytest.fixture
+def metadata(tmp_path):
+    manager = MetadataManager(cache_dir=tmp_path)
+    manager.cache_file.write_text(json.dumps(METADATA), encoding='utf-8')
+    assert manager.load_metadata()
+    return manager
+
+
+@pytest.mark.parametrize('raw, expected', [
+    ('1f600', '1f600'),
+    ('2764-fe0f', '2764'),
+    ('2764_FE0F', '2764'),
+    ('1f43b-200d-2744-fe0f', '1f43b_200d_2744'),
+])
+def test_normalize_codepoint(raw, expected):
+    assert MetadataManager._normalize_codepoint(raw) == expected
+
+
+def test_dash_joined_metadata_matches_underscore_codepoints(metadata):
+    assert metadata.is_valid_combination('😀', '🐻‍❄️') is True
+
+
+def test_variation_selector_is_ignored(metadata):
+    assert metadata.is_valid_combination('😀', '❤️') is True
+    assert metadata.is_valid_combination('😀', '❤') is True
+
+
+def test_lookup_is_symmetric(metadata):
+    assert metadata.is_valid_combination('❤️', '😀') is True
+    assert metadata.is_valid_combination('🐻‍❄️', '😀') is True
+
+
+def test_unknown_combination_is_false(metadata):
+    assert metadata.is_valid_combination('😀', '🔥') is False
+    assert metadata.is_valid_combination('🐶', '🐱') is False
+
+
+def test_not_loaded_returns_none(tmp_path):
+    manager = MetadataManager(cache_dir=tmp_path)
+    assert manager.is_valid_combination('😀', '❤️') is None
+    assert manager.find_combinations('😀') == []
+
+
+def test_find_combinations(metadata):
+    assert metadata.find_combinations('😀') == [('😀', '🐻‍❄️'), ('😀', '❤️')]
+    assert metadata.find_combinations('❤') == [('❤', '😀')]
+    assert metadata.find_combinations('🔥') == [('🔥', '🔥')]
+    assert metadata.find_combinations('🐶') == []
@@ -0,0 +1,39 @@
+"""Tests for StorageManager path generation and symmetric storage."""
+
+import pytest
+
+from src.emoji_kitchen.storage.manager import StorageManager
+
+
+@pytest.mark.parametrize('filename_format', ['emoji', 'codepoint', 'auto'])
+def test_symmetric_pairs_share_a_path(tmp_path, filename_format):
+    storage = StorageManager(tmp_path, filename_format, symmetric=True)
+
+    path = storage.get_file_path('😀', '🔥')
+
+    assert storage.get_file_path('🔥', '😀') == path
+    # Stored under the lower codepoint (🔥 U+1F525 < 😀 U+1F600)
+    assert path.parent == storage.get_emoji_directory('🔥')
+
+
+def test_symmetric_path_format(tmp_path):
+    storage = StorageManager(tmp_path, 'codepoint', symmetric=True)
+
+    assert storage.get_file_path('😀', '🔥') == tmp_path / '1f525' / '1f525_1f600.png'
+
+
+def test_asymmetric_pairs_keep_their_order(tmp_path):
+    storage = StorageManager(tmp_path, 'codepoint')
+
+    assert storage.get_file_path('😀', '🔥') == tmp_path / '1f600' / '1f600_1f525.png'
+    assert storage.get_file_path('🔥', '😀') == tmp_path / '1f525' / '1f525_1f600.png'
+
+
+def test_symmetric_save_is_found_in_either_order(tmp_path):
+    storage = StorageManager(tmp_path, 'codepoint', symmetric=True)
+
+    saved = storage.save('😀', '🔥', b'png')
+
+    assert saved.read_bytes() == b'png'
+    assert storage.file_exists('🔥', '😀')
+    assert storage.file_exists('😀', '🔥')